@@ -1,7 +1,7 @@
 from PyQt6.QtGui import QColor, QPalette, QBrush
 
 
-def set_frame_color_based_on_window(window, frame):
+def compute_frame_color(window):
     def adjust_color(color, factor):
         r, g, b, a = color.red(), color.green(), color.blue(), color.alpha()
         r = min(max(int(r * factor), 0), 255)
@@ -17,11 +17,16 @@ def set_frame_color_based_on_window(window, frame):
     main_bg_color = window.palette().color(QPalette.ColorRole.Window)
 
     if is_dark_mode(main_bg_color):
-        frame_bg_color = adjust_color(main_bg_color, 1.5)
-    else:
-        frame_bg_color = adjust_color(main_bg_color, 0.95)
+        return adjust_color(main_bg_color, 1.5)
+    return adjust_color(main_bg_color, 0.95)
+
 
+def apply_frame_color(frame, color):
     palette = frame.palette()
-    palette.setBrush(QPalette.ColorRole.Window, QBrush(frame_bg_color))
+    palette.setBrush(QPalette.ColorRole.Window, QBrush(color))
     frame.setAutoFillBackground(True)
     frame.setPalette(palette)
+
+
+def set_frame_color_based_on_window(window, frame):
+    apply_frame_color(frame, compute_frame_color(window))
@@ -2,12 +2,19 @@ import subprocess
 import sys
 import os
 import xml.etree.ElementTree as ET
+from typing import NamedTuple
 
 
 MULTIMONITORTOOL = os.path.join("dependencies", "multimonitortool.exe")
 MONITORS_XML = os.path.join("dependencies", "monitors.xml")
 
 
+class Monitor(NamedTuple):
+    name: str
+    is_active: bool
+    is_primary: bool
+
+
 def create_monitors_xml():
     try:
         subprocess.run([MULTIMONITORTOOL, "/sxml", MONITORS_XML], check=True)
@@ -48,14 +55,14 @@ def run_display_switch(mode):
 def toggle_monitors(monitor_names, enable):
     action = "/TurnOn" if enable else "/TurnOff"
     monitors = generate_monitors()
-    for monitor in monitors:
-        monitor_name = monitor[1]
-        if monitor_name in monitor_names:
-            try:
-                monitor_index = monitor[0]
-                subprocess.run([MULTIMONITORTOOL, action, monitor_index], check=True)
-            except subprocess.CalledProcessError as e:
-                print(f"Error toggling monitor {monitor_name}: {e}")
+    monitor_indexes = [monitor[0] for monitor in monitors if monitor[1] in monitor_names]
+    if not monitor_indexes:
+        return
+
+    try:
+        subprocess.run([MULTIMONITORTOOL, action, *monitor_indexes], check=True)
+    except subprocess.CalledProcessError as e:
+        print(f"Error toggling monitors {', '.join(monitor_names)}: {e}")
 
 
 def list_monitors():
@@ -0,0 +1,235 @@
+import os
+import sys
+import copy
+import json
+import darkdetect
+from functools import cache
+from PyQt6.QtWidgets import (
+    QApplication,
+    QMainWindow,
+    QSystemTrayIcon,
+    QMenu,
+    QCheckBox,
+    QLabel,
+    QWidget,
+    QGridLayout,
+)
+from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import QSize, Qt
+from design import Ui_MainWindow
+from monitor_manager import Monitor, generate_monitors, toggle_monitors, run_display_switch
+from shortcut_manager import check_startup_shortcut, manage_startup_shortcut
+from color_utils import compute_frame_color, apply_frame_color
+
+
+SETTINGS_FILE = os.path.join(os.environ["APPDATA"], "QMS", "settings.json")
+_SETTINGS_DIR_READY = False
+ICONS_FOLDER = "icons"
+ICON_APP = os.path.join(ICONS_FOLDER, "icon.png")
+ICON_TRAY = {
+    (variant, theme): os.path.join(ICONS_FOLDER, f"icon_{variant}_{theme}.png")
+    for variant in ("primary", "secondary")
+    for theme in ("light", "dark")
+}
+
+
+@cache
+def get_tray_icon(variant, theme):
+    return QIcon(ICON_TRAY[(variant, theme)])
+
+
+class QMS(QMainWindow):
+    def __init__(self, no_ddcci=False):
+        super().__init__()
+        self.no_ddcci = no_ddcci
+        self.ui = Ui_MainWindow()
+        self.ui.setupUi(self)
+        self._monitor_container = None
+        self.scan_monitors()
+        self.set_fusion_frames()
+        self.init_ui()
+        self.setWindowIcon(QIcon(ICON_APP))
+        self.settings = {}
+        self._settings_on_disk = None
+        self.first_run = False
+        self._strings = {
+            "enable": self.tr("Enable secondary monitors"),
+            "disable": self.tr("Disable secondary monitors"),
+            "settings": self.tr("Settings"),
+            "exit": self.tr("Exit"),
+        }
+        self._is_dark = darkdetect.isDark()
+        QApplication.styleHints().colorSchemeChanged.connect(self.handle_color_scheme_change)
+        self.secondary_monitors_enabled = self.get_active_monitors()
+        self.tray_icon = self.create_tray_icon()
+        self.load_settings()
+
+    def init_ui(self):
+        if not self.no_ddcci:
+            self.create_monitor_checkboxes()
+        self.ui.rescan_button.setVisible(not self.no_ddcci)
+        self.ui.monitors_frame.setVisible(not self.no_ddcci)
+        self.ui.label.setVisible(not self.no_ddcci)
+        self.adjustSize()
+        self.ui.startup_checkbox.setChecked(check_startup_shortcut())
+        self.ui.startup_checkbox.stateChanged.connect(
+            lambda state, ddcci=self.no_ddcci: manage_startup_shortcut(state, ddcci=ddcci)
+        )
+        self.ui.rescan_button.clicked.connect(self.create_monitor_checkboxes)
+
+    def set_fusion_frames(self):
+        if QApplication.style().objectName() == "fusion":
+            frame_color = compute_frame_color(self)
+            apply_frame_color(self.ui.gridFrame, frame_color)
+            apply_frame_color(self.ui.monitors_frame, frame_color)
+
+    def clear_monitor_checkboxes(self):
+        if self._monitor_container is not None:
+            self.ui.gridLayout_2.removeWidget(self._monitor_container)
+            self._monitor_container.deleteLater()
+
+        self._monitor_container = QWidget(self.ui.monitors_frame)
+        self._monitor_layout = QGridLayout(self._monitor_container)
+        self._monitor_layout.setContentsMargins(0, 0, 0, 0)
+        self._monitor_layout.setSpacing(self.ui.gridLayout_2.spacing())
+        self.ui.gridLayout_2.addWidget(self._monitor_container, 0, 0)
+
+    def scan_monitors(self):
+        self.monitors = [
+            Monitor(monitor[1], monitor[2] == "Yes", monitor[3] == "Yes") for monitor in generate_monitors()
+        ]
+        self._secondary_names = [monitor.name for monitor in self.monitors if not monitor.is_primary]
+
+    def create_monitor_checkboxes(self):
+        self.clear_monitor_checkboxes()
+        self.scan_monitors()
+        self.monitor_checkboxes = {}
+        for row, name in enumerate(self._secondary_names):
+            label = QLabel(name)
+            checkbox = QCheckBox()
+            checkbox.stateChanged.connect(self.save_settings)
+            label.setMinimumSize(QSize(0, 25))
+            checkbox.setMinimumSize(QSize(0, 25))
+            checkbox.setLayoutDirection(Qt.LayoutDirection.RightToLeft)
+            self._monitor_layout.addWidget(label, row, 0)
+            self._monitor_layout.addWidget(checkbox, row, 1)
+            self.monitor_checkboxes[name] = checkbox
+
+        self.ui.monitors_frame.adjustSize()
+        self.adjustSize()
+
+    def save_settings(self):
+        settings = {
+            "secondary_monitors": sorted(
+                monitor for monitor, checkbox in self.monitor_checkboxes.items() if checkbox.isChecked()
+            ),
+        }
+        if settings == self._settings_on_disk:
+            return
+
+        self.settings = settings
+        global _SETTINGS_DIR_READY
+        if not _SETTINGS_DIR_READY:
+            os.makedirs(os.path.dirname(SETTINGS_FILE), exist_ok=True)
+            _SETTINGS_DIR_READY = True
+        data = json.dumps(self.settings, separators=(",", ":"))
+        with open(SETTINGS_FILE, "w") as f:
+            f.write(data)
+        self._settings_on_disk = settings
+
+    def load_settings(self):
+        try:
+            with open(SETTINGS_FILE, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            self.first_run = True
+            return
+
+        self.settings = json.loads(data)
+        self._settings_on_disk = copy.deepcopy(self.settings)
+
+        saved_monitors = set(self.settings.get("secondary_monitors", ()))
+        try:
+            for monitor, checkbox in self.monitor_checkboxes.items():
+                checkbox.blockSignals(True)
+                checkbox.setChecked(monitor in saved_monitors)
+                checkbox.blockSignals(False)
+        except AttributeError:
+            pass
+
+    def create_tray_icon(self):
+        theme = self.get_tray_theme()
+        variant = "secondary" if not self.secondary_monitors_enabled else "primary"
+        tray_icon = QSystemTrayIcon(get_tray_icon(variant, theme))
+        tray_icon.setToolTip("QMS")
+        tray_icon.setContextMenu(self.create_tray_menu())
+        tray_icon.activated.connect(self.handle_tray_icon_click)
+        tray_icon.show()
+        return tray_icon
+
+    def handle_tray_icon_click(self, reason):
+        if reason == QSystemTrayIcon.ActivationReason.Trigger:
+            self.toggle_secondary_monitors()
+
+    def create_tray_menu(self):
+        menu = QMenu()
+
+        self._enable_action = menu.addAction(self.get_enable_action_text())
+        self._enable_action.triggered.connect(self.toggle_secondary_monitors)
+
+        settings_action = menu.addAction(self._strings["settings"])
+        settings_action.triggered.connect(self.show)
+
+        exit_action = menu.addAction(self._strings["exit"])
+        exit_action.triggered.connect(self.exit_app)
+
+        self.tray_menu = menu
+        return menu
+
+    def get_enable_action_text(self):
+        return self._strings["disable"] if self.secondary_monitors_enabled else self._strings["enable"]
+
+    def get_tray_theme(self):
+        return "light" if self._is_dark else "dark"
+
+    def handle_color_scheme_change(self):
+        self._is_dark = darkdetect.isDark()
+        self.update_tray_icon()
+
+    def update_tray_icon(self):
+        theme = self.get_tray_theme()
+        variant = "secondary" if not self.secondary_monitors_enabled else "primary"
+        self.tray_icon.setIcon(get_tray_icon(variant, theme))
+
+    def update_tray_menu(self):
+        self._enable_action.setText(self.get_enable_action_text())
+
+    def get_active_monitors(self):
+        for monitor in self.monitors:
+            if monitor.is_active and not monitor.is_primary:
+                return True
+        return False
+
+    def toggle_secondary_monitors(self):
+        if not self.secondary_monitors_enabled:
+            run_display_switch("/extend")
+        if not self.no_ddcci:
+            wanted = [monitor for monitor, checkbox in self.monitor_checkboxes.items() if checkbox.isChecked()]
+            if wanted:
+                toggle_monitors(wanted, enable=not self.secondary_monitors_enabled)
+
+        if self.secondary_monitors_enabled:
+            run_display_switch("/internal")
+        self.secondary_monitors_enabled = not self.secondary_monitors_enabled
+        self.update_tray_icon()
+        self.update_tray_menu()
+
+    def exit_app(self):
+        self.close()
+        self.tray_icon.hide()
+        QApplication.quit()
+        sys.exit()
+
+    def closeEvent(self, event):
+        event.ignore()
+        self.hide()
@@ -10,7 +10,7 @@ def run_pylupdate():
         subprocess.run(
             [
                 "pylupdate6.exe",
-                "./src/qms.py",
+                "./src/qms_window.py",
                 "./src/ui/design.ui",
                 "-ts",
                 f"./src/tr/{PROJECT}_fr.ts",